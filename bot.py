@@ -2,6 +2,7 @@ import os
 import requests
 import sys
 import re
+import json
 from datetime import datetime
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
@@ -182,17 +183,61 @@ def save_to_page(session, page_title, admins_data):
     else:
         new_text = current_text + "\n\n== Active admins ==\n" + new_table
 
+    edit_page(session, page_title, new_text, 'Updating active admins table (bot)')
+
+
+def build_activity_json(admins_data):
+    """Build the compact JSON payload for the activity data page.
+
+    Rows are ordered by rank and hold raw ISO timestamps (null when missing),
+    so rendering is left to the on-wiki module and unchanged data yields an
+    identical payload.
+    """
+    rows = []
+    for admin in admins_data:
+        rows.append([
+            admin['username'],
+            None if admin['last_edit'] == "—" else admin['last_edit'],
+            None if admin['last_log'] == "—" else admin['last_log'],
+        ])
+    return {
+        'columns': ['username', 'last_edit', 'last_log'],
+        'rows': rows
+    }
+
+
+def save_json_page(session, page_title, admins_data):
+    """Write the activity data to a JSON content model page."""
+    data = build_activity_json(admins_data)
+
+    # The server pretty-prints JSON pages on save, so compare parsed values.
+    current_text = get_current_page_text(session, page_title)
+    try:
+        if current_text and json.loads(current_text) == data:
+            print(f"✅ No changes for {page_title}")
+            return
+    except ValueError:
+        pass
+
+    new_text = json.dumps(data, separators=(',', ':'), ensure_ascii=False)
+    edit_page(session, page_title, new_text, 'Updating active admins data (bot)',
+              contentmodel='json')
+
+
+def edit_page(session, page_title, text, summary, **extra):
     token = get_csrf_token(session)
-    r = session.post(API_URL, data={
+    data = {
         'action': 'edit',
         'title': page_title,
-        'text': new_text,
+        'text': text,
         'token': token,
         'format': 'json',
         'bot': True,
-        'summary': 'Updating active admins table (bot)',
+        'summary': summary,
         'assert': 'user',
-    })
+    }
+    data.update(extra)
+    r = session.post(API_URL, data=data)
     result = r.json()
     if 'error' in result:
         print(f"❌ Edit error: {result}")
@@ -208,17 +253,27 @@ def run_bot():
     username = os.getenv("BOT_USERNAME")
     password = os.getenv("BOT_PASSWORD")
     save_page = "User:Fixinbot/Updates"
+    json_page = "User:Fixinbot/Updates.json"
+    # "wikitext" (default), "json", or "both"
+    output_mode = os.getenv("OUTPUT_MODE", "wikitext").lower()
 
     if not username or not password:
         print("❌ Missing BOT_USERNAME or BOT_PASSWORD environment variables")
         sys.exit(1)
 
+    if output_mode not in ("wikitext", "json", "both"):
+        print(f"❌ Unknown OUTPUT_MODE: {output_mode}")
+        sys.exit(1)
+
     session = login_and_get_session(username, password)
     admins = get_admins(session)
     print(f"👥 Found {len(admins)} admins")
 
     admins_data = get_all_activities(session, admins)
-    save_to_page(session, save_page, admins_data)
+    if output_mode in ("wikitext", "both"):
+        save_to_page(session, save_page, admins_data)
+    if output_mode in ("json", "both"):
+        save_json_page(session, json_page, admins_data)
 
 
 if __name__ == "__main__":
@@ -0,0 +1,39 @@
+-- Renders the active admins table from User:Fixinbot/Updates.json.
+-- Install as a Lua module (e.g. Module:Fixinbot/Updates) and use
+-- {{#invoke:Fixinbot/Updates|table}} on the page that shows the report.
+local p = {}
+
+local DATA_PAGE = 'User:Fixinbot/Updates.json'
+
+local function formatTimestamp(lang, ts)
+	if ts == nil then
+		return '—'
+	end
+	return lang:formatDate('F d, Y, H:i:s "UTC"', ts)
+end
+
+function p.table(frame)
+	local page = frame.args.page or DATA_PAGE
+	local data = mw.loadJsonData(page)
+	local lang = mw.language.getContentLanguage()
+
+	local lines = {
+		'{| class="wikitable sortable"',
+		'! Rank',
+		'! Username',
+		'! Last edit',
+		'! Last log'
+	}
+	for i, row in ipairs(data.rows) do
+		local username, lastEdit, lastLog = row[1], row[2], row[3]
+		table.insert(lines, '|-')
+		table.insert(lines, '| ' .. i)
+		table.insert(lines, '| [[User:' .. username .. '|' .. username .. ']]')
+		table.insert(lines, '| ' .. formatTimestamp(lang, lastEdit))
+		table.insert(lines, '| ' .. formatTimestamp(lang, lastLog))
+	end
+	table.insert(lines, '|}')
+	return table.concat(lines, '\n')
+end
+
+return p